@@ -182,6 +182,8 @@ class Inventory:
             initial_items: An optional list of initial items to put in inventory
         """
         self._items = {}
+        self._non_coin_items = {}  # Shares item lists with _items
+        self._coin_count = 0
         if initial_items is not None:
             for item in initial_items:
                 self.add_item(item)
@@ -196,12 +198,25 @@ class Inventory:
         items.append(item)
         self._items[item.get_name()] = items
 
+        if item.get_id() == COIN:
+            self._coin_count += 1
+        else:
+            self._non_coin_items[item.get_name()] = items
+
     def get_items(self) -> dict[str, list[Item]]:
         """ Returns the a dictionary mapping item names to the instances of the
             item with that name in the inventory.
         """
         return self._items
 
+    def get_non_coin_items(self) -> dict[str, list[Item]]:
+        """ Returns the same mapping as get_items, excluding coins. """
+        return self._non_coin_items
+
+    def get_coin_count(self) -> int:
+        """ Returns the number of coins in the inventory. """
+        return self._coin_count
+
     def remove_item(self, item_name: str) -> Optional['Item']:
         """ Removes one instance of the item with the given name from inventory,
             if one exists.
@@ -218,8 +233,11 @@ class Inventory:
             return None
         else:
             item = items.pop(0)
+            if item.get_id() == COIN:
+                self._coin_count -= 1
             if self._items.get(item_name) == []:
                 del self._items[item_name]
+                self._non_coin_items.pop(item_name, None)
             return item
     
     def __str__(self):
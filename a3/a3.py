@@ -1,9 +1,14 @@
+import ast
+import os
+import stat
+import tempfile
 import tkinter as tk
 
 from tkinter import messagebox, Toplevel, Menu, filedialog
+from time import monotonic
 from PIL import ImageTk, Image
 
-from typing import Callable, Union
+from typing import Any, Callable, Union
 from a2_solution import *
 from a2_support import UserInterface
 from a3_support import AbstractGrid
@@ -14,6 +19,8 @@ IMAGE_FILE = "images-custom/"
 
 DEFAULT_PADDING = 10
 
+TIMER_CACHE_MINUTES = 120
+
 STATS_COLUMN = 4
 STATS_ROW = 2
 STATS_TEXT = {
@@ -22,73 +29,204 @@ STATS_TEXT = {
     2: "Thirst"
 }
 
+# Item classes by name, as written in item reprs by older saves
+ITEM_CLASSES = {item.__name__: item for item in Level.ENTITIES.values()}
+
+# MazeRunnerFile parser method and default value of each saved game field
+# Fields without a default (None) must be present in the save file
+SAVE_FIELDS = {
+    "Level": ("_parse_level", 0),
+    "File": ("_parse_game_file", None),
+    "Entities": ("_parse_entities", {}),
+    "Inventory": ("_parse_inventory", []),
+    "Stats": ("_parse_stats", None),
+    "Position": ("_parse_position", None),
+    "Time": ("_parse_count", 0),
+}
+
 class LevelView(AbstractGrid):
     """ Displays maze tiles and entities on abstract grid. """
+    def set_dimensions(self, dimensions: tuple[int, int]) -> None:
+        """ Sets the dimensions of the grid and clears all drawn cells.
+
+        Parameters:
+            dimensions: (#rows, #columns)
+        """
+        super().set_dimensions(dimensions)
+
+        # Cell positions only change with the grid dimensions
+        num_rows, num_cols = dimensions
+        self._bbox_cache = [
+            [self.get_bbox((row, col)) for col in range(num_cols)]
+            for row in range(num_rows)
+        ]
+        self._midpoint_cache = [
+            [self.get_midpoint((row, col)) for col in range(num_cols)]
+            for row in range(num_rows)
+        ]
+
+        self.clear()
+
+    def clear(self) -> None:
+        """ Clears the canvas and forgets all previously drawn cells. """
+        super().clear()
+
+        # Canvas item ids of drawn cells, used to only redraw changed cells
+        num_rows, num_cols = self._dimensions
+        self._tile_items = {}
+        self._prev_tile_ids = [[None] * num_cols for _ in range(num_rows)]
+        self._item_items = {}
+        self._player_item = ()
+        self._player_pos = None
+
     def draw(
         self,
         tiles: list[list[Tile]],
         items: dict[tuple[int, int], Item],
         player_pos: tuple[int, int]
     ) -> None:
-        """ Draws maze tiles and entities.
+        """ Draws maze tiles and entities which changed since the last draw.
 
         Parameters:
             tiles: Tile objects to draw.
             items: Item objects to draw.
             player_pos: Position to draw player.
         """
-        self.clear()
+        for row, tile_row in enumerate(tiles):
+            prev_tile_ids = self._prev_tile_ids[row]
+            for col, tile in enumerate(tile_row):
+                if prev_tile_ids[col] != tile.get_id():
+                    self._redraw_tile(tile, (row, col))
+
+        # Remove drawn items which have been collected or replaced
+        for pos, (drawn_item, item_ids) in list(self._item_items.items()):
+            if items.get(pos) is not drawn_item:
+                self.delete(*item_ids)
+                del self._item_items[pos]
+
+        items_drawn = False
+        for pos, item in items.items():
+            if pos not in self._item_items:
+                self._item_items[pos] = (item, self._draw_items(item))
+                items_drawn = True
+
+        if not self._player_item:
+            self._player_item = self._draw_player(player_pos)
+        else:
+            if player_pos != self._player_pos:
+                self._move_player(player_pos)
 
-        num_rows, num_cols = self._dimensions
-        for row in range(num_rows):
-            for col in range(num_cols):
-                pos = (row, col)
-                self._draw_tiles(tiles[row][col], pos)
+            # Keep player drawn above any newly drawn items
+            if items_drawn:
+                for player_item in self._player_item:
+                    self.tag_raise(player_item)
 
-                if pos in items:
-                    self._draw_items(items[pos])
-        
-        self._draw_player(player_pos)
+        self._player_pos = player_pos
+
+    def _redraw_tile(
+        self,
+        tile: Tile,
+        pos: tuple[int, int]
+    ) -> None:
+        """ Updates the drawn tile at a position, reusing its canvas item.
+
+        Parameters:
+            tile: Tile object to draw.
+            pos: Position to draw tile.
+        """
+        if pos in self._tile_items:
+            self._configure_tile(self._tile_items[pos], tile)
+        else:
+            self._tile_items[pos] = self._draw_tiles(tile, pos)
+
+        row, col = pos
+        self._prev_tile_ids[row][col] = tile.get_id()
+
+    def _configure_tile(
+        self,
+        tile_item: int,
+        tile: Tile
+    ) -> None:
+        """ Changes the appearance of an existing tile canvas item.
+
+        Parameters:
+            tile_item: Canvas item id of the drawn tile.
+            tile: Tile object to draw.
+        """
+        self.itemconfigure(tile_item, fill=TILE_COLOURS[tile.get_id()])
 
     def _draw_tiles(
         self, 
         tile: Tile,
         pos: tuple[int, int]
-    ) -> None:
+    ) -> int:
         """ Draw tile objects on abstract grid.
 
         Parameters:
             tile: Tile object to draw.
             pos: Position to draw tile.
+
+        Returns:
+            Canvas item id of the drawn tile.
         """
-        cell_bbox = self.get_bbox(pos)
-        self.create_rectangle(cell_bbox, fill=TILE_COLOURS[tile.get_id()])
+        row, col = pos
+        cell_bbox = self._bbox_cache[row][col]
+        return self.create_rectangle(
+            cell_bbox, 
+            fill=TILE_COLOURS[tile.get_id()]
+        )
 
     def _draw_items(
         self,
         item: Item
-    ) -> None:
+    ) -> tuple[int, ...]:
         """ Draw item objects on abstract grid.
 
         Parameters:
             item: Item object to draw.
+
+        Returns:
+            Canvas item ids of the drawn item.
         """
-        cell_bbox = self.get_bbox(item.get_position())
-        self.create_oval(cell_bbox, fill=ENTITY_COLOURS[item.get_id()])
-        self.annotate_position(item.get_position(), item.get_id())
+        row, col = item.get_position()
+        cell_bbox = self._bbox_cache[row][col]
+        return (
+            self.create_oval(cell_bbox, fill=ENTITY_COLOURS[item.get_id()]),
+            self.annotate_position(item.get_position(), item.get_id())
+        )
 
     def _draw_player(
         self,
         player_pos: tuple[int, int]
-    ) -> None:
+    ) -> tuple[int, ...]:
         """ Draw player on abstract grid.
 
         Parameters:
             player_pos: Position to draw player.
+
+        Returns:
+            Canvas item ids of the drawn player.
         """
-        cell_bbox = self.get_bbox(player_pos)
-        self.create_oval(cell_bbox, fill=ENTITY_COLOURS[PLAYER])
-        self.annotate_position(player_pos, PLAYER)
+        row, col = player_pos
+        cell_bbox = self._bbox_cache[row][col]
+        return (
+            self.create_oval(cell_bbox, fill=ENTITY_COLOURS[PLAYER]),
+            self.annotate_position(player_pos, PLAYER)
+        )
+
+    def _move_player(
+        self,
+        player_pos: tuple[int, int]
+    ) -> None:
+        """ Moves the drawn player to a new position on abstract grid.
+
+        Parameters:
+            player_pos: Position to move player to.
+        """
+        row, col = player_pos
+        player_oval, player_text = self._player_item
+        self.coords(player_oval, *self._bbox_cache[row][col])
+        self.coords(player_text, *self._midpoint_cache[row][col])
 
 class StatsView(AbstractGrid):
     """ Displays player stats and coins on abstract grid. """
@@ -108,34 +246,58 @@ class StatsView(AbstractGrid):
         size = (width, STATS_HEIGHT)
 
         super().__init__(master, dimensions, size, **kwargs)
+        self.clear()
+
+    def clear(self) -> None:
+        """ Clears the canvas and forgets all previously drawn stats. """
+        super().clear()
+
+        # Last drawn values, used to only redraw changed stats
+        self._last_stats = None
+        self._last_coins = None
 
     def draw_stats(
         self, 
         player_stats: tuple[int, int, int]
     ) -> None:
-        """ Draws player stats.
+        """ Draws player stats which changed since the last draw.
 
         Parameters:
             player_stats: Current player stats (HP, hunger, thirst)
         """
+        if player_stats == self._last_stats:
+            return
+
         for stat_index in range(len(player_stats)):
+            if (
+                self._last_stats is not None and 
+                self._last_stats[stat_index] == player_stats[stat_index]
+            ):
+                continue
+
             # Draw player stats in 0 to 3rd coloumn 
             self._draw_stat_label(
                 stat_index, STATS_TEXT[stat_index], 
                 player_stats[stat_index]
             )
 
+        self._last_stats = player_stats
+
     def draw_coins(
         self,
         num_coins: int
     ) -> None:
-        """ Draws the numbers of coins.
+        """ Draws the numbers of coins if changed since the last draw.
 
         Parameters:
             num_coins: Number of coins in player inventory.
         """
+        if num_coins == self._last_coins:
+            return
+
         # Draw coin stat in 4th coloumn 
         self._draw_stat_label(3, "Coins", num_coins)
+        self._last_coins = num_coins
 
     def _draw_stat_label(
         self,
@@ -153,11 +315,11 @@ class StatsView(AbstractGrid):
         """
         # Row 0 is stat header
         stat_header_pos = (0, stat_index)
-        self.annotate_position(stat_header_pos, stat_text)
+        self.annotate_position_persistent(stat_header_pos, stat_text)
 
         # Row 1 is stat value
         stat_value_pos = (1, stat_index)
-        self.annotate_position(stat_value_pos, stat_value)
+        self.annotate_position_persistent(stat_value_pos, stat_value)
 
 class InventoryView(tk.Frame):
     """ Displays player inventory in frame. """
@@ -171,7 +333,20 @@ class InventoryView(tk.Frame):
         Parameters:
             master: Root game window.
         """
-        super().__init__(master, width = INVENTORY_WIDTH, **kwargs)
+        super().__init__(
+            master, 
+            width = INVENTORY_WIDTH, 
+            height = MAZE_HEIGHT, 
+            **kwargs
+        )
+
+        # Stop item labels from resizing the frame and repacking the window
+        self.pack_propagate(False)
+
+        # Labels are reused between draws instead of being recreated
+        self._header_label = None
+        self._item_labels = []
+        self._label_names = {}  # Item name currently shown by each label
 
     def set_click_callback(
         self, 
@@ -183,23 +358,19 @@ class InventoryView(tk.Frame):
             callback: Function that is called when inventory item is pressed.
         """
         self._item_callback = callback
-        
-    def clear(self) -> None:
-        """ Clears all child widgets from the inventory view. """
-        for item_button in self.winfo_children():
-            item_button.destroy()
 
     def draw_inventory(
         self, 
-        inventory: Inventory
+        items: dict[str, list[Item]]
     ) -> None:
         """ Draws all non-coin items with their quantities.
 
         Parameters:
-            inventory: Modified player inventory without Coin items.
+            items: Player inventory items without Coin items.
         """
         self._draw_inventory_header()
-        for item, value in inventory.get_items().items():
+
+        for index, (item, value) in enumerate(items.items()):
             item_name = item
             item_count = len(value)
 
@@ -207,46 +378,74 @@ class InventoryView(tk.Frame):
             # Therefore, retireve instance 0 
             item_colour = ENTITY_COLOURS[value[0].get_id()]
 
-            self._draw_item(item_name, item_count, item_colour)
+            self._draw_item(index, item_name, item_count, item_colour)
+
+        # Hide labels left over from items no longer in the inventory
+        for item_label in self._item_labels[len(items):]:
+            item_label.pack_forget()
 
     def _draw_item(
         self, 
+        index: int,
         name: str, 
         num: int, 
         colour: str
     ) -> None:
-        """ Creates inventory view item instance and binds click callback.
+        """ Updates inventory view item instance with item details.
 
         Parameters:
+            index: Position of item in inventory view.
             name: Name of inventory item.
             num: Quantity of item in inventory.
             colour: Item background colour.
         """
-        item_label = tk.Label(
-            self,
+        if index < len(self._item_labels):
+            item_label = self._item_labels[index]
+        else:
+            item_label = tk.Label(
+                self,
+                font = TEXT_FONT
+            )
+            item_label.bind("<Button>", self._handle_item_click)
+            self._item_labels.append(item_label)
+
+        item_label.config(
             text = f"{name}: {num}",
-            font = TEXT_FONT,
             bg = colour
         )
-        item_label.pack(
-            side = tk.TOP,
-            fill = tk.BOTH
-        )
-        item_label.bind("<Button>", lambda event: self._item_callback(name))
+        self._label_names[item_label] = name
+
+        # Only pack labels which are not already shown
+        if not item_label.winfo_manager():
+            item_label.pack(
+                side = tk.TOP,
+                fill = tk.BOTH
+            )
+
+    def _handle_item_click(self, event: tk.Event) -> None:
+        """ Calls the item callback with the name of the clicked item.
+
+        Parameters:
+            event: Click event on an inventory item label.
+        """
+        self._item_callback(self._label_names[event.widget])
 
     def _draw_inventory_header(
         self,
     ) -> None:
         """ Draws inventory header label. """
-        header_label = tk.Label(
-            self,
-            text="Inventory",
-            font=HEADING_FONT
-        )
-        header_label.pack(
-            side = tk.TOP,
-            fill = tk.BOTH
-        )
+        if self._header_label is None:
+            self._header_label = tk.Label(
+                self,
+                text="Inventory",
+                font=HEADING_FONT
+            )
+
+        if not self._header_label.winfo_manager():
+            self._header_label.pack(
+                side = tk.TOP,
+                fill = tk.BOTH
+            )
 
 class GraphicalInterface(UserInterface):
     """ A MazeRunner interface that uses GUI to present information.  """
@@ -384,12 +583,6 @@ class GraphicalInterface(UserInterface):
 
         self._master.minsize(root_min_width, root_min_height)
 
-    def clear_all(self) -> None:
-        """ Clears all elements from component view GUI objects. """
-        self._level_view.clear()
-        self._inventory_view.clear()
-        self._stats_view.clear()
-
     def set_maze_dimensions(
         self, 
         dimensions: tuple[int, int]
@@ -544,24 +737,9 @@ class GraphicalInterface(UserInterface):
         self, 
         inventory: Inventory
     ) -> None:
-        coins = 0
-        modified_inventory = inventory
-
-        if "Coin" in inventory.get_items():
-            modified_items = []
-            coins = len(inventory.get_items()["Coin"])
-
-            # Create new list of items with coin removed
-            for item_group in inventory.get_items().values():
-                for item in item_group:
-                    if str(item) != COIN:
-                        modified_items.append(item)
-
-            # Create new inventory from modified items
-            modified_inventory = Inventory(modified_items)
-
-        self._inventory_view.draw_inventory(modified_inventory)
-        self._stats_view.draw_coins(coins)
+        # Coins are shown in the stats view instead of the inventory
+        self._inventory_view.draw_inventory(inventory.get_non_coin_items())
+        self._stats_view.draw_coins(inventory.get_coin_count())
 
 class GraphicalMazeRunner(MazeRunner):
     """ Graphical controller class for a game of MazeRunner. """
@@ -569,7 +747,9 @@ class GraphicalMazeRunner(MazeRunner):
         self._root = root
         self._game_file = game_file
         self._view = GraphicalInterface(root)
+        self._redraw_pending = False
         super().__init__(game_file, self._view)
+        self._update_maze_dimensions()
 
     def _handle_keypress(self, e: tk.Event) -> None:
         """ Handles player input and checks if valid.
@@ -586,6 +766,10 @@ class GraphicalMazeRunner(MazeRunner):
         """ Returns true if the player has won or lost. """
         return self._model.has_won() or self._model.has_lost()
 
+    def _update_maze_dimensions(self) -> None:
+        """ Caches the dimensions of the current maze after it changes. """
+        self._maze_dimensions = self._model.get_current_maze().get_dimensions()
+
     def _handle_move(self, move: str) -> None:
         self._model.move_player(MOVE_DELTAS.get(move))
         self._handle_level_update()
@@ -594,9 +778,8 @@ class GraphicalMazeRunner(MazeRunner):
         """ Checks for model state changes. """
         # Update interface with new maze dimensions if level up
         if self._model.did_level_up():
-            self._view.set_maze_dimensions(
-                self._model.get_current_maze().get_dimensions()
-            )
+            self._update_maze_dimensions()
+            self._view.set_maze_dimensions(self._maze_dimensions)
 
         # Stop game timer when player finishes 
         if self._get_finished_state() and TASK == 2:
@@ -630,22 +813,36 @@ class GraphicalMazeRunner(MazeRunner):
         model = self._model
         time = self._view.get_time()
 
-        if file_path is not None:
+        # Dialog returns an empty string when cancelled
+        if file_path:
             MazeRunnerFile(model=model,file_path=file_path,time=time).save()
         
     def _handle_load_game(self) -> None:
         """ Read current game state from text file. """
         file_path = filedialog.askopenfilename()
 
-        if file_path is not None:
-            try:
-                model_state = MazeRunnerFile(file_path=file_path).load()
-                self._create_new_game_model(
-                    model_state[0]
-                )
-                self._view.set_time(model_state[1])
-            except:
-                self._create_message_box("Select Valid File Type!")
+        # Dialog returns an empty string when cancelled
+        if not file_path:
+            return
+
+        if not file_path.endswith(".txt"):
+            self._create_message_box("Select Valid File Type!")
+            return
+
+        try:
+            model_state = MazeRunnerFile(file_path=file_path).load()
+        except (
+            OSError, 
+            SyntaxError, 
+            ValueError, 
+            TypeError, 
+            LookupError
+        ):
+            self._create_message_box("Select Valid File Type!")
+            return
+
+        self._create_new_game_model(model_state[0])
+        self._view.set_time(model_state[1])
                 
     def _handle_quit_game(self) -> None:
         """ Quit current game. """
@@ -677,8 +874,13 @@ class GraphicalMazeRunner(MazeRunner):
         Parameters:
             item_name: The applied item's name.
         """
-        item = self._model.get_player().get_inventory().remove_item(item_name)
-        item.apply(self._model.get_player())
+        player = self._model.get_player()
+        item = player.get_inventory().remove_item(item_name)
+
+        # Clicks can arrive before the deferred redraw removes a used label
+        if item is None:
+            return
+        item.apply(player)
         self._redraw()
 
     def _create_file_prompt(
@@ -753,9 +955,8 @@ class GraphicalMazeRunner(MazeRunner):
             model: New game model.
         """
         self._model = model
-        self._view.set_maze_dimensions(
-            self._model.get_current_maze().get_dimensions()
-        )
+        self._update_maze_dimensions()
+        self._view.set_maze_dimensions(self._maze_dimensions)
         self._view.reset_time()
         self._redraw()
 
@@ -770,9 +971,7 @@ class GraphicalMazeRunner(MazeRunner):
             self._game_file = game_file
 
     def play(self) -> None:
-        self._view.create_interface(
-            self._model.get_current_maze().get_dimensions()
-        )
+        self._view.create_interface(self._maze_dimensions)
         self._view.set_inventory_callback(self._apply_item)
         self._view.bind_keypress(self._handle_keypress)
 
@@ -788,7 +987,15 @@ class GraphicalMazeRunner(MazeRunner):
         self._redraw()
 
     def _redraw(self) -> None:
-        self._view.clear_all()
+        """ Schedules a redraw for when the event loop is next idle. """
+        # Collapse redraws requested in the same event loop iteration
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self._root.after_idle(self._handle_redraw)
+
+    def _handle_redraw(self) -> None:
+        """ Redraws the entire view based on the current model state. """
+        self._redraw_pending = False
         super()._redraw()
 
 class ImageLevelView(LevelView):
@@ -804,58 +1011,107 @@ class ImageLevelView(LevelView):
         """ Initialises image level view. """
         super().__init__(master, dimensions, size, **kwargs)
         self._images_raw = {}  # List of PIL.Image
-        self._images_tk = {}  # List of PIL.ImageTK
-        self._image_size = self.get_cell_size()
+        self._images_tk = {}  # List of PIL.ImageTK by (tile ID, size)
+        self._preload_images()
+
+    def _preload_images(self) -> None:
+        """ Reads and sizes the image of every tile and entity in the game. """
+        cell_size = self.get_cell_size()
+
+        for tile_id in Maze.TILES:
+            self._store_image(tile_id, TILE_IMAGES[tile_id], cell_size)
+
+        for entity_id in (*Level.ENTITIES, PLAYER):
+            self._store_image(entity_id, ENTITY_IMAGES[entity_id], cell_size)
 
     def _draw_tiles(
         self, 
         tile: Tile,
         tile_pos: tuple[int, int]
-    ) -> None:
-        self._create_image(
+    ) -> int:
+        return self._create_image(
             TILE_IMAGES[tile.get_id()], 
             tile_pos, 
             tile.get_id()
         )
 
+    def _configure_tile(
+        self,
+        tile_item: int,
+        tile: Tile
+    ) -> None:
+        self.itemconfigure(
+            tile_item,
+            image=self._get_image(TILE_IMAGES[tile.get_id()], tile.get_id())
+        )
+
     def _draw_items(
         self,
         item: Item
-    ) -> None:
-        self._create_image(
+    ) -> tuple[int, ...]:
+        return (self._create_image(
             ENTITY_IMAGES[item.get_id()], 
             item.get_position(), 
             item.get_id()
-        )
+        ),)
 
     def _draw_player(
         self,
         player_pos: tuple[int, int]
-    ) -> None:
-        self._create_image(
+    ) -> tuple[int, ...]:
+        return (self._create_image(
             ENTITY_IMAGES[PLAYER], 
             player_pos, 
             PLAYER
-        )
+        ),)
+
+    def _move_player(
+        self,
+        player_pos: tuple[int, int]
+    ) -> None:
+        row, col = player_pos
+        player_image, = self._player_item
+        self.coords(player_image, *self._midpoint_cache[row][col])
 
     def _create_image(
         self, 
         filename: str, 
         tile_pos: tuple[int, int],
         tile_id: str
-    ) -> None:
+    ) -> int:
         """ Draws image of tile cell on level canvas.
 
         Parameters:
             filename: The path to the image file.
             tile_pos: The grid position (row, column) of the tile to add.
             tile_id: The ID of the tile to add.
+
+        Returns:
+            Canvas item id of the drawn image.
+        """
+        row, col = tile_pos
+        cell_mid = self._midpoint_cache[row][col]
+        cell_image = self._get_image(filename, tile_id)
+        return self.create_image(cell_mid, image=cell_image)
+
+    def _get_image(
+        self,
+        filename: str,
+        tile_id: str
+    ) -> ImageTk.PhotoImage:
+        """ Returns the image of a tile sized to fit the current cells.
+
+        Parameters:
+            filename: The path to the image file.
+            tile_id: The ID of the tile to get.
         """
-        cell_mid = self.get_midpoint(tile_pos)
         cell_size = self.get_cell_size()
 
-        self._store_image(tile_id, filename, cell_size)
-        self.create_image(cell_mid, image=self._images_tk[tile_id])
+        # Only process image if it has not been made for this cell size
+        if (tile_id, cell_size) not in self._images_tk:
+            self._store_image(tile_id, filename, cell_size)
+
+        return self._images_tk[(tile_id, cell_size)]
 
     def _store_image(
         self, 
@@ -870,48 +1126,35 @@ class ImageLevelView(LevelView):
             filename: The path to the image file.
             size: The desired (width, height) of image.
         """
-        # Only add image to dictionary if it has not been proccessed
+        # Only read image file if it has not been proccessed
         if tile_id not in self._images_raw:
             with Image.open(IMAGE_FILE + filename) as tile_image:
                 # Create dictionary of raw PIL.Image to limit file reads
-                self._images_raw[tile_id] = tile_image
+                # Copy loads image data before file stream is closed
+                self._images_raw[tile_id] = tile_image.copy()
 
-                # Resize PIL.Image to fit current cell size
-                self._store_image_tk(
-                    tile_id, 
-                    self._images_raw[tile_id].resize(size, Image.NEAREST)
-                )
+        # Resize PIL.Image to fit current cell size, if not already that size
+        tile_image = self._images_raw[tile_id]
+        if tile_image.size != size:
+            tile_image = tile_image.resize(size, Image.Resampling.NEAREST)
 
-        # Update image sizes
-        if self._image_size != size:
-            self._resize_images_tk(size)
-            self._image_size = size
+        self._store_image_tk(tile_id, size, tile_image)
          
     def _store_image_tk(
         self, 
         tile_id: str,
+        size: tuple[int, int],
         tile_image: Image
     ) -> None:
         """ Stores processed PIL.ImageTK in memory.
 
         Parameters:
             tile_id: The ID of the tile to add.
+            size: The (width, height) of the processed image.
             tile_image: Unprocessed Image to store in dictionary.
         """
         # Create dictionary of raw PIL.ImageTK to stop garbage collection
-        self._images_tk[tile_id] = ImageTk.PhotoImage(tile_image)
-
-    def _resize_images_tk(
-        self, 
-        size: tuple[int, int]
-    ) -> None:
-        """ Resizes all PIL.ImageTK elements to new size.
-
-        Parameters:
-            size: The desired (width, height) of image.
-        """
-        for tile_id, image in self._images_raw.items():
-            self._store_image_tk(tile_id, image.resize(size, Image.NEAREST))
+        self._images_tk[(tile_id, size)] = ImageTk.PhotoImage(tile_image)
 
 class ControlsFrame(tk.Frame):
     """ Displays game state control buttons and timer GUI objects. """
@@ -923,7 +1166,16 @@ class ControlsFrame(tk.Frame):
         """ Initialises controls frame. """
         self._master = master
         self._timer_running = True
+        self._timer_paused = False
+        self._timer_update = None  # ID of the scheduled timer tick
         self._time = 0
+
+        # Formatted times, indexed by seconds, for typical game lengths
+        self._timer_formats = tuple(
+            f"{minutes}m {seconds}s" 
+            for minutes in range(TIMER_CACHE_MINUTES) 
+            for seconds in range(60)
+        )
         super().__init__(master, **kwargs)
 
     def draw(self) -> None:
@@ -1003,9 +1255,11 @@ class ControlsFrame(tk.Frame):
         )
 
         # Create timer value
+        self._timer_text = self._handle_timer_format(self._time)
+        self._timer_var = tk.StringVar(self, value=self._timer_text)
         self._timer_value = tk.Label(
             timer_frame,
-            text=self._handle_timer_format(self._time),
+            textvariable=self._timer_var,
             font=TEXT_FONT
         )
         self._timer_value.pack(
@@ -1013,6 +1267,11 @@ class ControlsFrame(tk.Frame):
             fill=tk.BOTH
         )
 
+        # Pause timer while the game window is minimised
+        toplevel = self.winfo_toplevel()
+        toplevel.bind("<Unmap>", self._handle_window_unmap, add="+")
+        toplevel.bind("<Map>", self._handle_window_map, add="+")
+
     def get_time(self) -> int:
         """ Get game time"""
         return self._time
@@ -1021,35 +1280,92 @@ class ControlsFrame(tk.Frame):
         self._time = time
 
         # Cancel current timer
-        self._timer_value.after_cancel(self._timer_update)
-        self._timer_value.config(text=self._handle_timer_format(self._time))
+        self._cancel_timer()
+        self._update_timer_text()
         self.start_timer()
 
     def start_timer(self) -> None:
         """ Starts timer. """
+        self._timer_running = True
+
+        # Only one tick may be scheduled at a time
+        self._cancel_timer()
+
+        # While the window is minimised, the timer restarts when it is shown
+        if self._timer_paused:
+            return
+
+        # Time at which the timer would have read zero
+        self._timer_start = monotonic() - self._time
         self._handle_timer()
 
     def stop_timer(self) -> None:
         """ Stops timer. """
-        self._timer_value.after_cancel(self._timer_update)
+        self._timer_running = False
+        self._timer_paused = False
+        self._cancel_timer()
         
     def reset_timer(self) -> None:
         """ Reset timer. """
         self._time = 0
-        self._timer_value.config(text=self._handle_timer_format(self._time))
+        self._update_timer_text()
 
         # Cancel current timer
-        self._timer_value.after_cancel(self._timer_update)
+        self._cancel_timer()
         self.start_timer()
 
     def _handle_timer(self) -> None:
         """ Increments and formats timer every second. """
-        self._timer_value.config(text=self._handle_timer_format(self._time))
-
-        # Recursively call function every second
-        self._timer_update = self._timer_value.after(1000, self._handle_timer)
+        self._update_timer_text()
         self._time += 1
 
+        # Schedule next second from timer start so delays do not accumulate
+        next_ms = round((self._timer_start + self._time - monotonic()) * 1000)
+        self._timer_update = self._timer_value.after(
+            max(0, next_ms), 
+            self._handle_timer
+        )
+
+    def _cancel_timer(self) -> None:
+        """ Cancels the scheduled timer tick, if there is one. """
+        if self._timer_update is not None:
+            self._timer_value.after_cancel(self._timer_update)
+            self._timer_update = None
+
+    def _handle_window_unmap(self, event: tk.Event) -> None:
+        """ Pauses the running timer when the game window is hidden.
+
+        Parameters:
+            event: Unmap event of the game window or one of its children.
+        """
+        # Child widgets also report unmap events through the window binding
+        if event.widget is not self.winfo_toplevel():
+            return
+
+        if self._timer_running and not self._timer_paused:
+            self._timer_paused = True
+            self._cancel_timer()
+
+    def _handle_window_map(self, event: tk.Event) -> None:
+        """ Resumes a paused timer when the game window is shown again.
+
+        Parameters:
+            event: Map event of the game window or one of its children.
+        """
+        if event.widget is not self.winfo_toplevel():
+            return
+
+        if self._timer_paused:
+            self._timer_paused = False
+            self.start_timer()
+
+    def _update_timer_text(self) -> None:
+        """ Updates the displayed time if its formatted text has changed. """
+        timer_text = self._handle_timer_format(self._time)
+        if timer_text != self._timer_text:
+            self._timer_var.set(timer_text)
+            self._timer_text = timer_text
+
     def _handle_timer_format(self, time: int) -> str:
         """ Converts time to minutes and seconds in formatted string.
 
@@ -1059,6 +1375,9 @@ class ControlsFrame(tk.Frame):
         Return:
             Formatted string in form Xm Xs
         """
+        if time < len(self._timer_formats):
+            return self._timer_formats[time]
+
         minutes, seconds = divmod(time, 60)
         return f"{minutes}m {seconds}s"
 
@@ -1108,9 +1427,18 @@ class MenuView(tk.Menu):
         self._quit_callback = callback
 
     def create_menus(self) -> None:
-        """ Create file menu within menu view. """
-        file_menu = Menu(self)
-        self.add_cascade(label="File", menu=file_menu)
+        """ Create file menu within menu view, filled when first opened. """
+        self._file_menu = Menu(self, postcommand=self._populate_file_menu)
+        self._file_menu_populated = False
+        self.add_cascade(label="File", menu=self._file_menu)
+
+    def _populate_file_menu(self) -> None:
+        """ Adds commands to the file menu the first time it is opened. """
+        if self._file_menu_populated:
+            return
+
+        self._file_menu_populated = True
+        file_menu = self._file_menu
 
         self._create_sub_menu(
             "Save game", 
@@ -1152,58 +1480,98 @@ class MenuView(tk.Menu):
         parent_menu.add_command(label=menu_name, command=callback)
 
 class MazeRunnerFile():
+    """ Saves and loads MazeRunner game state as .txt files. """
+    __slots__ = ("_file_path", "_model", "_time")
+
     def __init__(
         self,
-        **kwargs
+        file_path: str,
+        model: Optional[Model] = None,
+        time: int = 0
     ) -> None:
         """ Initialise Maze Runner File with optional parameters.
 
         Parameters:
-            **kwargs: file_path, model, time
+            file_path: The path to the save file.
+            model: Game model to save.
+            time: Game time in seconds to save.
         """
-
-        # Save kwargs variable to object
-        for key, value in kwargs.items():
-            if key == "file_path":
-                self._file_path = value
-            elif key == "model":
-                self._model = value
-            elif key == "time":
-                self._time = value
+        self._file_path = file_path
+        self._model = model
+        self._time = time
 
     def save(self) -> None:
         """ Saves model as .txt file as file path. """
         model = self._model
-        # Create list of save varaiables
-        file_write = []
-
-        level_number = f"Level {model._level_num}"
-        file_write.append(self._save_formatting(level_number))
-
-        game_file = f"File {model._game_file}" 
-        file_write.append(self._save_formatting(game_file))
-
-        level_entities = f'Entities {model.get_current_items()}'
-        file_write.append(self._save_formatting(level_entities))
+        player = model.get_player()
+        level_items = model.get_current_items()
+        inventory_items = player.get_inventory().get_items()
+
+        # Items are saved as IDs and positions so they load as literals
+        entities = {
+            position: item.get_id() for position, item in level_items.items()
+        }
+        inventory = {
+            item_group[0].get_id(): [
+                item.get_position() for item in item_group
+            ]
+            for item_group in inventory_items.values()
+        }
+
+        # Game state to save, one line per field
+        state = {
+            "Level": model._level_num,
+            "File": model._game_file,
+            "Entities": entities,
+            "Inventory": inventory,
+            "Stats": (
+                player.get_health(), 
+                player.get_hunger(), 
+                player.get_thirst()
+            ),
+            "Position": player.get_position(),
+            "Time": self._time,
+        }
 
-        inventory_items = (
-            f'Inventory {model.get_player_inventory().get_items()}'
+        # Create list of save varaiables
+        # Values use repr so they can be read back as Python literals
+        file_write = [f"{field} {value!r}\n" for field, value in state.items()]
+
+        # Write to a unique temporary file beside the save so a failed save
+        # keeps the old file and never overwrites another file
+        temp_file = tempfile.NamedTemporaryFile(
+            "w", 
+            buffering = 65536, 
+            dir = os.path.dirname(os.path.abspath(self._file_path)), 
+            suffix = ".tmp", 
+            delete = False
         )
+        try:
+            with temp_file:
+                # Write saved variables as .txt file in a single write
+                temp_file.write("".join(file_write))
 
-        file_write.append(self._save_formatting(inventory_items))
-
-        player_stats = f"Stats {model.get_player_stats()}"
-        file_write.append(self._save_formatting(player_stats))
-
-        player_position = f"Position {model.get_player().get_position()}"
-        file_write.append(self._save_formatting(player_position))
+            # Temporary files are owner-only, so give it the save's mode
+            os.chmod(temp_file.name, self._get_file_mode())
+            os.replace(temp_file.name, self._file_path)
+        except Exception:
+            os.remove(temp_file.name)
+            raise
 
-        game_time = f"Time {self._time}"
-        file_write.append(self._save_formatting(game_time))
+    def _get_file_mode(self) -> int:
+        """ Returns the permission bits the save file should be written with.
 
-        with open(self._file_path, "w") as file:
-            # Write list of saved variables as .txt file
-            file.writelines(file_write)
+        Returns:
+            Mode of the existing save file, otherwise the default mode for 
+            new files under the current umask.
+        """
+        try:
+            return stat.S_IMODE(os.stat(self._file_path).st_mode)
+        except FileNotFoundError:
+            # The umask can only be read by setting it, so restore it
+            umask = os.umask(0)
+            os.umask(umask)
+            return 0o666 & ~umask
 
     def load(self) -> tuple[Model, int]:
         """ Loads a saved game .txt file from file path.
@@ -1211,65 +1579,270 @@ class MazeRunnerFile():
         Returns:
             Tuple with new Model as first element and game time as second.
         """
-        level_number = 0
-        game_file = ""
-        level_entities = {}
-        inventory_items = {}
-        player_stats = ()
-        player_position = ()
-        game_time = 0
+        # Game state read from file, with defaults for missing fields
+        state = {
+            field: default for field, (_, default) in SAVE_FIELDS.items()
+        }
 
+        # Save files are small, so read all lines at once
         with open(self._file_path, "r") as file:
-            for line in file:
-                line = line.strip()
-                if line.startswith('Level'):
-                    level_number = int(line[6:].split(' ')[0])
-                elif line.startswith('File'):
-                    game_file = line[5:].split(' ')[0]
-                elif line.startswith('Entities'):
-                    level_entities = eval(line[9:])
-                elif line.startswith('Inventory'):
-                    inventory_items = eval(line[10:])
-                elif line.startswith('Stats'):
-                    player_stats = eval(line[6:])
-                elif line.startswith('Position'):
-                    player_position = eval(line[9:])
-                elif line.startswith('Time '):
-                    game_time = int(line[5:])
+            lines = file.read().splitlines()
+
+        for line in lines:
+            # Field name is the first word of each line
+            field, _, value = line.partition(' ')
+            if field in SAVE_FIELDS:
+                parser_name, _ = SAVE_FIELDS[field]
+                state[field] = getattr(self, parser_name)(value)
+
+        missing_fields = [
+            field for field, value in state.items() if value is None
+        ]
+        if missing_fields:
+            raise ValueError(f"Save file is missing fields: {missing_fields}")
+
+        return self._create_model(state), state["Time"]
+
+    def _create_model(self, state: dict[str, Any]) -> Model:
+        """ Creates a new model with the loaded game state.
+
+        Parameters:
+            state: Game state read from a save file.
+
+        Returns:
+            Model of the loaded game.
+        """
+        level_number = state["Level"]
+        player_stats = state["Stats"]
 
         # Create new model with loaded game file
-        model = Model(game_file)
+        model = Model(state["File"])
+
+        # Saved positions must lie within the saved level's maze
+        num_rows, num_cols = model._levels[level_number].get_dimensions()
+        for row, col in (state["Position"], *state["Entities"]):
+            if not (0 <= row < num_rows and 0 <= col < num_cols):
+                raise ValueError(
+                    f"Saved position is outside maze: {(row, col)}"
+                )
 
         # Overwrite required model variable to load state
-        model._player = Player(player_position)
-        model._player._inventory._items = inventory_items
+        model._player = Player(state["Position"])
+        for item in state["Inventory"]:
+            model._player.add_item(item)
         model._player._health = player_stats[0]
         model._player._hunger = player_stats[1]
         model._player._thirst = player_stats[2]
         model._level_num = level_number
-        model._levels[level_number]._items = level_entities
+        model._levels[level_number]._items = state["Entities"]
         model._levels[level_number].attempt_unlock_door()
         
-        return (model, game_time)
-                    
-    def _save_formatting(
-        self, 
-        save_value: str, 
-        remove_chars: Optional[str] = ""
-    ) -> str:
-        """ Formats save variable and removes optional characters. 
-        
+        return model
+
+    @staticmethod
+    def _is_int_tuple(value: Any, length: int) -> bool:
+        """ Returns True iff value is a tuple of the given number of ints.
+
+        Parameters:
+            value: Value to check.
+            length: Required number of elements.
+        """
+        return (
+            isinstance(value, tuple) and 
+            len(value) == length and 
+            all(isinstance(element, int) for element in value)
+        )
+
+    @staticmethod
+    def _parse_count(value: str) -> int:
+        """ Parses a saved non-negative integer, such as a level or time.
+
+        Parameters:
+            value: Saved integer text.
+
+        Returns:
+            The integer value.
+        """
+        count = int(value)
+        if count < 0:
+            raise ValueError(f"Saved count is negative: {value}")
+        return count
+
+    @classmethod
+    def _parse_int_tuple(cls, value: str, length: int) -> tuple[int, ...]:
+        """ Parses a saved tuple of ints, such as a position or player stats.
+
+        Parameters:
+            value: Saved tuple literal.
+            length: Required number of elements.
+
+        Returns:
+            The tuple of ints.
+        """
+        ints = ast.literal_eval(value)
+        if not cls._is_int_tuple(ints, length):
+            raise ValueError(f"Saved value is not {length} integers: {value}")
+        return ints
+
+    @classmethod
+    def _literal_eval_items(cls, value: str) -> Any:
+        """ Evaluates a saved Python literal which may contain item reprs.
+
+        Item reprs such as Coin((1, 2)), written by older saves, are created as
+        items. No other calls or names are accepted.
+
+        Parameters:
+            value: Saved text of a Python literal.
+
+        Returns:
+            The evaluated value.
+        """
+        def evaluate(node: ast.AST) -> Any:
+            if (
+                isinstance(node, ast.Call) and 
+                isinstance(node.func, ast.Name) and 
+                node.func.id in ITEM_CLASSES and 
+                len(node.args) == 1 and 
+                not node.keywords
+            ):
+                position = ast.literal_eval(node.args[0])
+                if not cls._is_int_tuple(position, 2):
+                    raise ValueError(
+                        f"Saved item position is invalid: {value}"
+                    )
+                return ITEM_CLASSES[node.func.id](position)
+            if isinstance(node, ast.Dict):
+                return {
+                    evaluate(key): evaluate(item) 
+                    for key, item in zip(node.keys, node.values)
+                }
+            if isinstance(node, ast.List):
+                return [evaluate(element) for element in node.elts]
+            if isinstance(node, ast.Tuple):
+                return tuple(evaluate(element) for element in node.elts)
+            return ast.literal_eval(node)
+
+        return evaluate(ast.parse(value.strip(), mode="eval").body)
+
+    @classmethod
+    def _parse_entities(cls, value: str) -> dict[tuple[int, int], Item]:
+        """ Parses saved level entities, saved as IDs or as item reprs.
+
         Parameters:
-            save_value: Unformatted string needing formatting.
-            remove_chars: Optional string of characters for removal.
+            value: Saved mapping of positions to entities.
 
         Returns:
-            Formatted string with attached newline character. 
+            Mapping of positions to the items at those positions.
         """
-        for character in remove_chars:
-            save_value = save_value.replace(character, "")
+        saved_entities = cls._literal_eval_items(value)
+        if not isinstance(saved_entities, dict):
+            raise ValueError(f"Saved entities are not a mapping: {value}")
+
+        entities = {}
+        for position, entity in saved_entities.items():
+            if not cls._is_int_tuple(position, 2):
+                raise ValueError(f"Saved entity position is invalid: {value}")
+
+            if not isinstance(entity, Item):
+                if not isinstance(entity, str) or entity not in Level.ENTITIES:
+                    raise ValueError(f"Saved entity is unknown: {entity!r}")
+                entity = Level.ENTITIES[entity](position)
+            entities[position] = entity
+        return entities
+
+    @classmethod
+    def _parse_inventory(cls, value: str) -> list[Item]:
+        """ Parses saved inventory items, saved as positions or as item reprs.
 
-        return f"{save_value}\n"
+        Parameters:
+            value: Saved mapping of item IDs to item positions, or older 
+                   mapping of item names to item reprs.
+
+        Returns:
+            Items in the inventory.
+        """
+        saved_items = cls._literal_eval_items(value)
+        if not isinstance(saved_items, dict):
+            raise ValueError(f"Saved inventory is not a mapping: {value}")
+
+        items = []
+        for item_key, item_group in saved_items.items():
+            if not isinstance(item_group, list):
+                raise ValueError(
+                    f"Saved inventory group is not a list: {value}"
+                )
+
+            for item in item_group:
+                if not isinstance(item, Item):
+                    if (
+                        not isinstance(item_key, str) or 
+                        item_key not in Level.ENTITIES or 
+                        not cls._is_int_tuple(item, 2)
+                    ):
+                        raise ValueError(
+                            f"Saved inventory item is invalid: {value}"
+                        )
+                    item = Level.ENTITIES[item_key](item)
+                items.append(item)
+        return items
+
+    @staticmethod
+    def _parse_game_file(value: str) -> str:
+        """ Parses the saved game file path, quoted or unquoted in older saves.
+
+        Parameters:
+            value: Saved game file path.
+
+        Returns:
+            The game file path.
+        """
+        value = value.strip()
+        if value.startswith(("'", '"')):
+            game_file = ast.literal_eval(value)
+        else:
+            # Older saves store the path unquoted, ending at the first space
+            game_file = value.partition(' ')[0]
+
+        if not isinstance(game_file, str):
+            raise ValueError(f"Saved game file is not a path: {value}")
+
+        return game_file
+
+    @classmethod
+    def _parse_level(cls, value: str) -> int:
+        """ Parses the saved level number, which may be followed by text.
+
+        Parameters:
+            value: Saved level number.
+
+        Returns:
+            The level number.
+        """
+        return cls._parse_count(value.partition(' ')[0])
+
+    @classmethod
+    def _parse_stats(cls, value: str) -> tuple[int, int, int]:
+        """ Parses the saved (health, hunger, thirst) player stats.
+
+        Parameters:
+            value: Saved player stats tuple.
+
+        Returns:
+            The player stats.
+        """
+        return cls._parse_int_tuple(value, 3)
+
+    @classmethod
+    def _parse_position(cls, value: str) -> tuple[int, int]:
+        """ Parses the saved (row, column) player position.
+
+        Parameters:
+            value: Saved player position tuple.
+
+        Returns:
+            The player position.
+        """
+        return cls._parse_int_tuple(value, 2)
 
 def play_game(root: tk.Tk):
     """ Initialises MazerRunner gameplay. """
@@ -1,5 +1,5 @@
 import tkinter as tk
-from typing import Union
+from typing import Hashable, Optional, Union
 
 from constants import TEXT_FONT
 
@@ -29,6 +29,7 @@ class AbstractGrid(tk.Canvas):
             **kwargs
         )
         self._size = size
+        self._text_items = {}
         self.set_dimensions(dimensions)
     
     def set_dimensions(self, dimensions: tuple[int, int]) -> None:
@@ -76,16 +77,42 @@ class AbstractGrid(tk.Canvas):
         y_pos = row * cell_height + cell_height // 2
         return x_pos, y_pos
 
-    def annotate_position(self, position: tuple[int, int], text: str) -> None:
+    def annotate_position(self, position: tuple[int, int], text: str) -> int:
         """ Annotates the cell at the given (row, col) position with the
             provided text.
 
         Parameters:
             position: The (row, col) cell position.
             text: The text to draw.
+
+        Returns:
+            The canvas item id of the created text.
+        """
+        return self.create_text(self.get_midpoint(position), text=text, font=TEXT_FONT)
+
+    def annotate_position_persistent(
+        self,
+        position: tuple[int, int],
+        text: str,
+        key: Optional[Hashable] = None
+    ) -> None:
+        """ Annotates the cell at the given (row, col) position with the
+            provided text, reusing the text drawn previously with the same key.
+
+        Parameters:
+            position: The (row, col) cell position.
+            text: The text to draw.
+            key: Identifies the annotation. Defaults to the position.
         """
-        self.create_text(self.get_midpoint(position), text=text, font=TEXT_FONT)
+        if key is None:
+            key = position
+
+        if key in self._text_items:
+            self.itemconfigure(self._text_items[key], text=text)
+        else:
+            self._text_items[key] = self.annotate_position(position, text)
 
     def clear(self):
         """ Clears all child widgets off the canvas. """
         self.delete("all")
+        self._text_items = {}